@@ -1,15 +1,16 @@
 # src/analysis.py
 
 import os
-import csv
-from typing import List, Dict, Any
+from typing import List, Dict
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from .config import BarrierOptionParams
-from .monte_carlo import price_barrier_monte_carlo
-from .binomial_tree import price_barrier_binomial_tree
+from .monte_carlo import price_barrier_monte_carlo, warmup as warmup_monte_carlo
+from .binomial_tree import price_barrier_binomial_tree, warmup as warmup_binomial_tree
+
+# Columnar result set: column name -> array with one entry per step count
+Results = Dict[str, np.ndarray]
 
 
 def ensure_directories():
@@ -22,115 +23,139 @@ def run_mc_convergence(
     n_paths: int,
     steps_list: List[int],
     seed: int | None = 42,
-) -> List[Dict[str, Any]]:
+    n_jobs: int = 1,
+    sampler: str = "pseudo",
+    control_variate: bool = False,
+) -> Results:
     """
     Run Monte Carlo pricing for different time steps to study convergence.
+    sampler: "pseudo" (i.i.d. normals), "lhs" (Latin hypercube) or "sobol" (QMC with Brownian bridge)
+    Returns a column -> array mapping, one entry per step count.
     """
-    results = []
-    for n_steps in steps_list:
+    n_steps_arr = np.asarray(steps_list, dtype=int)
+    prices = np.empty(len(n_steps_arr))
+    std_errors = np.empty(len(n_steps_arr))
+    runtimes = np.empty(len(n_steps_arr))
+
+    # JIT compilation and worker startup happen here, not in the first timed call
+    warmup_monte_carlo(n_jobs)
+
+    for i, n_steps in enumerate(steps_list):
         price, std_err, runtime = price_barrier_monte_carlo(
-            params, n_paths=n_paths, n_steps=n_steps, antithetic=True, seed=seed
+            params, n_paths=n_paths, n_steps=n_steps, antithetic=True, seed=seed, n_jobs=n_jobs,
+            sampler=sampler, control_variate=control_variate,
         )
-        results.append({
-            "method": "MC",
-            "n_steps": n_steps,
-            "n_paths": n_paths,
-            "price": price,
-            "std_error": std_err,
-            "runtime": runtime,
-        })
+        prices[i], std_errors[i], runtimes[i] = price, std_err, runtime
         print(f"[MC] steps={n_steps}, price={price:.4f}, stderr={std_err:.4f}, time={runtime:.4f}s")
-    return results
+
+    return {
+        "method": np.full(len(n_steps_arr), "MC"),
+        "n_steps": n_steps_arr,
+        "n_paths": np.full(len(n_steps_arr), n_paths),
+        "price": prices,
+        "std_error": std_errors,
+        "runtime": runtimes,
+    }
 
 
 def run_tree_convergence(
     params: BarrierOptionParams,
     steps_list: List[int],
-) -> List[Dict[str, Any]]:
+) -> Results:
     """
     Run binomial tree pricing for different numbers of steps.
+    Returns a column -> array mapping with the same columns as run_mc_convergence;
+    the MC-only columns n_paths and std_error are NaN.
     """
-    results = []
-    for n_steps in steps_list:
+    n_steps_arr = np.asarray(steps_list, dtype=int)
+    prices = np.empty(len(n_steps_arr))
+    runtimes = np.empty(len(n_steps_arr))
+
+    warmup_binomial_tree()
+
+    for i, n_steps in enumerate(steps_list):
         price, runtime = price_barrier_binomial_tree(params, n_steps=n_steps)
-        results.append({
-            "method": "Tree",
-            "n_steps": n_steps,
-            "n_paths": None,
-            "price": price,
-            "std_error": None,
-            "runtime": runtime,
-        })
+        prices[i], runtimes[i] = price, runtime
         print(f"[Tree] steps={n_steps}, price={price:.4f}, time={runtime:.4f}s")
-    return results
+
+    return {
+        "method": np.full(len(n_steps_arr), "Tree"),
+        "n_steps": n_steps_arr,
+        "n_paths": np.full(len(n_steps_arr), np.nan),
+        "price": prices,
+        "std_error": np.full(len(n_steps_arr), np.nan),
+        "runtime": runtimes,
+    }
 
 
-def save_results_to_csv(records: List[Dict[str, Any]], filename: str = "data/results.csv"):
+def save_results_to_csv(results: List[Results] | Results, filename: str = "data/results.csv"):
+    """
+    Write a list of result sets (or a single one) to a single CSV, one row per step count.
+    NaN entries (e.g. std_error for the tree) are left empty.
+    """
+    import pandas as pd
+
+    if isinstance(results, dict):
+        results = [results]
+    if not all(isinstance(res, dict) for res in results):
+        raise TypeError("results must be a result set or a list of result sets")
+
     fieldnames = ["method", "n_steps", "n_paths", "price", "std_error", "runtime"]
-    with open(filename, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for rec in records:
-            writer.writerow(rec)
+    df = pd.concat([pd.DataFrame(res) for res in results], ignore_index=True)
+    df = df.reindex(columns=fieldnames)
+    # nullable integer so tree rows (NaN n_paths) are written empty, not as floats
+    df["n_paths"] = df["n_paths"].astype("Int64")
+    df.to_csv(filename, index=False)
     print(f"Saved results to {filename}")
 
 
-def plot_convergence(records: List[Dict[str, Any]]):
+def plot_convergence(mc: Results | None = None, tree: Results | None = None):
     """
-    Generate basic convergence and runtime plots from the records list.
+    Generate convergence, runtime and MC standard error plots from the MC and
+    tree result sets, side by side in a single figure.
     """
+    # Imported here so runs that never plot skip matplotlib's startup cost
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     ensure_directories()
 
-    # Convert to arrays for convenience
-    mc = [r for r in records if r["method"] == "MC"]
-    tree = [r for r in records if r["method"] == "Tree"]
+    fig, (ax_price, ax_time, ax_err) = plt.subplots(1, 3, figsize=(18, 5))
 
     # --- Price vs Steps ---
-    plt.figure()
     if mc:
-        mc_steps = [r["n_steps"] for r in mc]
-        mc_price = [r["price"] for r in mc]
-        plt.plot(mc_steps, mc_price, marker="o", label="MC price")
+        ax_price.plot(mc["n_steps"], mc["price"], marker="o", label="MC price")
     if tree:
-        tree_steps = [r["n_steps"] for r in tree]
-        tree_price = [r["price"] for r in tree]
-        plt.plot(tree_steps, tree_price, marker="s", label="Tree price")
+        ax_price.plot(tree["n_steps"], tree["price"], marker="s", label="Tree price")
 
-    plt.xlabel("Number of Time Steps / Tree Steps")
-    plt.ylabel("Option Price")
-    plt.title("Price Convergence: Monte Carlo vs Binomial Tree")
-    plt.legend()
-    plt.grid(True)
-    plt.savefig("plots/price_convergence.png", bbox_inches="tight")
+    ax_price.set_xlabel("Number of Time Steps / Tree Steps")
+    ax_price.set_ylabel("Option Price")
+    ax_price.set_title("Price Convergence: Monte Carlo vs Binomial Tree")
+    ax_price.legend()
+    ax_price.grid(True)
 
     # --- Runtime vs Steps ---
-    plt.figure()
     if mc:
-        mc_steps = [r["n_steps"] for r in mc]
-        mc_time = [r["runtime"] for r in mc]
-        plt.plot(mc_steps, mc_time, marker="o", label="MC runtime")
+        ax_time.plot(mc["n_steps"], mc["runtime"], marker="o", label="MC runtime")
     if tree:
-        tree_steps = [r["n_steps"] for r in tree]
-        tree_time = [r["runtime"] for r in tree]
-        plt.plot(tree_steps, tree_time, marker="s", label="Tree runtime")
+        ax_time.plot(tree["n_steps"], tree["runtime"], marker="s", label="Tree runtime")
 
-    plt.xlabel("Number of Steps")
-    plt.ylabel("Runtime (seconds)")
-    plt.title("Runtime vs Steps: Monte Carlo vs Binomial Tree")
-    plt.legend()
-    plt.grid(True)
-    plt.savefig("plots/runtime_comparison.png", bbox_inches="tight")
+    ax_time.set_xlabel("Number of Steps")
+    ax_time.set_ylabel("Runtime (seconds)")
+    ax_time.set_title("Runtime vs Steps: Monte Carlo vs Binomial Tree")
+    ax_time.legend()
+    ax_time.grid(True)
 
     # --- MC Std Error vs Steps (if available) ---
     if mc:
-        plt.figure()
-        mc_steps = [r["n_steps"] for r in mc]
-        mc_err = [r["std_error"] for r in mc]
-        plt.plot(mc_steps, mc_err, marker="o")
-        plt.xlabel("Number of Steps")
-        plt.ylabel("MC Standard Error")
-        plt.title("Monte Carlo Standard Error vs Time Steps")
-        plt.grid(True)
-        plt.savefig("plots/mc_std_error.png", bbox_inches="tight")
-
-    print("Saved plots in 'plots/' directory")
+        ax_err.plot(mc["n_steps"], mc["std_error"], marker="o")
+    ax_err.set_xlabel("Number of Steps")
+    ax_err.set_ylabel("MC Standard Error")
+    ax_err.set_title("Monte Carlo Standard Error vs Time Steps")
+    ax_err.grid(True)
+
+    fig.savefig("plots/convergence.png", bbox_inches="tight")
+    plt.close(fig)
+
+    print("Saved plots to 'plots/convergence.png'")
@@ -1,6 +1,10 @@
 # src/barrier_option.py
 
+import math
+
 import numpy as np
+from scipy.stats import norm
+
 from .config import BarrierOptionParams
 
 
@@ -28,6 +32,20 @@ def vanilla_payoff(ST: float, params: BarrierOptionParams) -> float:
         raise ValueError(f"Unknown option_type: {params.option_type}")
 
 
+def black_scholes_price(params: BarrierOptionParams) -> float:
+    """Closed-form Black-Scholes price of the vanilla European option (no barrier)."""
+    S0, K, r, sigma, T = params.S0, params.K, params.r, params.sigma, params.T
+    d1 = (math.log(S0 / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+    d2 = d1 - sigma * math.sqrt(T)
+
+    if params.option_type == "call":
+        return S0 * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d2)
+    elif params.option_type == "put":
+        return K * math.exp(-r * T) * norm.cdf(-d2) - S0 * norm.cdf(-d1)
+    else:
+        raise ValueError(f"Unknown option_type: {params.option_type}")
+
+
 def barrier_payoff_from_path(path: np.ndarray, params: BarrierOptionParams) -> float:
     """
     Barrier option payoff given a full path of S_t.
@@ -36,4 +54,50 @@ def barrier_payoff_from_path(path: np.ndarray, params: BarrierOptionParams) -> f
     if barrier_hit(path, params):
         return 0.0  # knocked out
     ST = path[-1]
-    return vanilla_payoff(ST, params)
\ No newline at end of file
+    return vanilla_payoff(ST, params)
+
+
+def vanilla_payoffs(ST: np.ndarray, params: BarrierOptionParams) -> np.ndarray:
+    """Vectorized vanilla European payoff over an array of terminal prices."""
+    if params.option_type == "call":
+        return np.maximum(ST - params.K, 0.0)
+    elif params.option_type == "put":
+        return np.maximum(params.K - ST, 0.0)
+    else:
+        raise ValueError(f"Unknown option_type: {params.option_type}")
+
+
+def barrier_payoffs_from_paths(S_paths: np.ndarray, params: BarrierOptionParams) -> np.ndarray:
+    """
+    Vectorized barrier payoffs for a whole batch of paths.
+    S_paths: array of shape (n_paths, n_steps + 1)
+    """
+    # min/max reductions avoid materializing an (n_paths, n_steps + 1) boolean mask
+    if params.barrier_type == "down-and-out":
+        extreme = S_paths.min(axis=1)
+    elif params.barrier_type == "up-and-out":
+        extreme = S_paths.max(axis=1)
+    else:
+        raise ValueError(f"Unknown barrier_type: {params.barrier_type}")
+
+    return barrier_payoffs_from_extremes(S_paths[:, -1], extreme, params)
+
+
+def barrier_payoffs_from_extremes(
+    ST: np.ndarray,
+    extreme: np.ndarray,
+    params: BarrierOptionParams,
+) -> np.ndarray:
+    """
+    Vectorized barrier payoffs from terminal prices and running extremes.
+    extreme: running minimum (down-and-out) or maximum (up-and-out) of each path
+    """
+    B = params.barrier
+    if params.barrier_type == "down-and-out":
+        hit = extreme <= B
+    elif params.barrier_type == "up-and-out":
+        hit = extreme >= B
+    else:
+        raise ValueError(f"Unknown barrier_type: {params.barrier_type}")
+
+    return np.where(hit, 0.0, vanilla_payoffs(ST, params))
@@ -3,8 +3,76 @@
 import math
 import time
 from typing import Tuple
-from .config import BarrierOptionParams
-from .barrier_option import vanilla_payoff
+
+import numpy as np
+
+from .config import BarrierOptionParams, DEFAULT_PARAMS
+from .barrier_option import vanilla_payoffs
+from .jit import njit, USE_NUMBA
+
+
+def _maturity_values(params: BarrierOptionParams, n_steps: int, u: float) -> np.ndarray:
+    """Option values at the N + 1 maturity nodes, computed in one vectorized pass."""
+    # S_T(j) = S0 * u^j * d^(N-j) = S0 * u^(2j - N) with d = 1/u
+    j = np.arange(n_steps + 1)
+    S_T = params.S0 * u ** (2 * j - n_steps)
+
+    option_values = vanilla_payoffs(S_T, params)
+
+    # At maturity, if barrier already crossed at this node, approximate knockout
+    if params.barrier_type == "down-and-out":
+        option_values[S_T <= params.barrier] = 0.0
+    else:
+        option_values[S_T >= params.barrier] = 0.0
+    return option_values
+
+
+@njit(fastmath=True, cache=True)
+def _crr_backward(option_values, n_steps, S0, u, d, pdisc, qdisc, B, is_down):
+    """
+    JIT kernel for CRR backward induction with a knock-out barrier checked at every node.
+    Starts from the maturity values and updates option_values in place;
+    element 0 holds the price at the root. pdisc and qdisc are the discounted
+    up and down probabilities, disc * p and disc * (1 - p).
+    """
+    # Node prices are walked by incremental multiplies instead of pow calls:
+    # S(i, j + 1) = S(i, j) * u / d and S(i, 0) = S(i + 1, 0) / d
+    ud = u / d
+    S_low = S0 * d**n_steps
+
+    # Backward induction
+    for i in range(n_steps - 1, -1, -1):
+        S_low /= d
+        S_ij = S_low
+        for j in range(i + 1):
+            # If barrier violated at this node, knock out
+            if (is_down and S_ij <= B) or (not is_down and S_ij >= B):
+                option_values[j] = 0.0
+            else:
+                # risk-neutral expected discounted value
+                option_values[j] = pdisc * option_values[j + 1] + qdisc * option_values[j]
+            S_ij *= ud
+
+    return option_values
+
+
+def _crr_backward_numpy(option_values, n_steps, S0, u, d, pdisc, qdisc, B, is_down):
+    """
+    NumPy version of `_crr_backward`: each tree level is swept with a few vector ops.
+    Used when Numba is not available or disabled.
+    """
+    # S_T(j) = S0 * u^j * d^(N-j)
+    j = np.arange(n_steps + 1)
+    S_level = S0 * u**j * d ** (n_steps - j)
+
+    # Backward induction, one level per iteration: S(i, j) = S(i + 1, j) / d
+    for i in range(n_steps - 1, -1, -1):
+        S_level = S_level[:-1] / d
+        V = pdisc * option_values[1:i + 2] + qdisc * option_values[:i + 1]
+        V[S_level <= B if is_down else S_level >= B] = 0.0
+        option_values[:i + 1] = V
+
+    return option_values
 
 
 def price_barrier_binomial_tree(
@@ -21,7 +89,7 @@ def price_barrier_binomial_tree(
     """
     start_time = time.time()
 
-    S0, K, r, sigma, T = params.S0, params.K, params.r, params.sigma, params.T
+    S0, r, sigma, T = params.S0, params.r, params.sigma, params.T
     B = params.barrier
 
     dt = T / n_steps
@@ -31,37 +99,31 @@ def price_barrier_binomial_tree(
     a = math.exp(r * dt)
     p = (a - d) / (u - d)
 
-    # stock prices and option values at maturity
-    stock_prices = [0.0] * (n_steps + 1)
-    option_values = [0.0] * (n_steps + 1)
-
-    for j in range(n_steps + 1):
-        # S_T(j) = S0 * u^j * d^(N-j)
-        S_T = S0 * (u**j) * (d ** (n_steps - j))
-        stock_prices[j] = S_T
+    # discounted risk-neutral probabilities, hoisted out of the node loop
+    pdisc = disc * p
+    qdisc = disc * (1.0 - p)
 
-        # At maturity, if barrier already crossed at this node, approximate knockout
-        if (params.barrier_type == "down-and-out" and S_T <= B) or \
-           (params.barrier_type == "up-and-out" and S_T >= B):
-            option_values[j] = 0.0
-        else:
-            option_values[j] = vanilla_payoff(S_T, params)
+    if params.barrier_type not in ("down-and-out", "up-and-out"):
+        raise ValueError(f"Unknown barrier_type: {params.barrier_type}")
+    if params.option_type not in ("call", "put"):
+        raise ValueError(f"Unknown option_type: {params.option_type}")
 
-    # Backward induction
-    for i in range(n_steps - 1, -1, -1):
-        for j in range(i + 1):
-            # Stock price at node (i, j)
-            S_ij = S0 * (u**j) * (d ** (i - j))
+    option_values = _maturity_values(params, n_steps, u)
 
-            # If barrier violated at this node, knock out
-            if (params.barrier_type == "down-and-out" and S_ij <= B) or \
-               (params.barrier_type == "up-and-out" and S_ij >= B):
-                option_values[j] = 0.0
-            else:
-                # risk-neutral expected discounted value
-                option_values[j] = disc * (p * option_values[j + 1] + (1 - p) * option_values[j])
+    backward = _crr_backward if USE_NUMBA else _crr_backward_numpy
+    # float() so integer-valued params reuse the warmed-up compiled signature
+    option_values = backward(
+        option_values, int(n_steps), float(S0), u, d, pdisc, qdisc, float(B),
+        params.barrier_type == "down-and-out",
+    )
 
-    price = option_values[0]
+    price = float(option_values[0])
     runtime = time.time() - start_time
 
     return price, runtime
+
+
+def warmup():
+    """Compile (or load from the on-disk cache) the JIT backward induction before any timed call."""
+    if USE_NUMBA:
+        price_barrier_binomial_tree(DEFAULT_PARAMS, n_steps=2)
@@ -0,0 +1,36 @@
+# src/jit.py
+#
+# Optional Numba support. When Numba is not installed, `njit` becomes a no-op
+# decorator and `prange` falls back to `range`, so kernels still run as plain Python.
+# Set BARRIER_USE_NUMBA=0 to use the NumPy implementations even if Numba is installed
+# (for small problems the JIT compile can cost more than it saves).
+# The parallel MC kernel is only used when Numba has more than one thread; on a single
+# core the vectorized NumPy path is faster (see monte_carlo._use_jit_kernel).
+
+import os
+
+try:
+    from numba import get_num_threads, njit, prange, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def set_num_threads(n):
+        """No-op stand-in for numba.set_num_threads."""
+
+    def get_num_threads():
+        """Stand-in for numba.get_num_threads: plain Python runs on one thread."""
+        return 1
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and parametrized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+USE_NUMBA = NUMBA_AVAILABLE and os.environ.get("BARRIER_USE_NUMBA", "1") != "0"
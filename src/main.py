@@ -24,12 +24,11 @@ def main():
     mc_results = run_mc_convergence(params, n_paths=n_paths, steps_list=mc_steps_list, seed=123)
     tree_results = run_tree_convergence(params, steps_list=tree_steps_list)
 
-    # Combine and save
-    all_records = mc_results + tree_results
-    save_results_to_csv(all_records, filename="data/results.csv")
+    # Save both result sets to one CSV
+    save_results_to_csv([mc_results, tree_results], filename="data/results.csv")
 
     # Make basic plots
-    plot_convergence(all_records)
+    plot_convergence(mc_results, tree_results)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,30 @@
 # src/monte_carlo.py
 
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 import numpy as np
-from typing import Tuple
-from .config import BarrierOptionParams
-from .barrier_option import barrier_payoff_from_path
+from typing import List, Tuple
+from scipy.stats import norm, qmc
+
+from .config import BarrierOptionParams, DEFAULT_PARAMS
+from .barrier_option import (
+    barrier_payoffs_from_extremes,
+    barrier_payoffs_from_paths,
+    black_scholes_price,
+    vanilla_payoffs,
+)
+from .jit import get_num_threads, njit, prange, set_num_threads, USE_NUMBA
+
+# Paths per independently seeded block in the JIT kernel (even, so antithetic pairs never straddle blocks)
+_MC_BLOCK_SIZE = 1024
+
+# Streaming MC: check for knocked-out paths every this many steps, and drop them
+# from the working set once fewer than this fraction of the current set survive
+_COMPACT_EVERY = 50
+_COMPACT_BELOW = 0.75
 
 
 def simulate_gbm_paths(
@@ -12,70 +32,604 @@ def simulate_gbm_paths(
     n_paths: int,
     n_steps: int,
     antithetic: bool = True,
-    seed: int | None = None,
+    seed: int | np.random.SeedSequence | None = None,
+    sampler: str = "pseudo",
+    dtype: type = np.float64,
 ) -> np.ndarray:
     """
     Simulate GBM paths for the underlying asset using Euler discretization in log-space.
+    sampler: "pseudo" for i.i.d. normals, or "lhs" for Latin hypercube shocks
+    (each time step's normals are stratified into n_paths equiprobable strata).
+    Latin hypercube stratification supersedes antithetic pairing, so `antithetic`
+    is ignored for "lhs".
+    dtype: np.float32 halves memory traffic; its rounding error is far below MC error.
     Returns an array of shape (n_paths, n_steps + 1).
     """
-    if seed is not None:
-        np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     S0, r, sigma, T = params.S0, params.r, params.sigma, params.T
     dt = T / n_steps
 
+    if sampler == "lhs":
+        antithetic = False
+
     # number of *base* paths (we will double them with antithetic if True)
     base_paths = n_paths if not antithetic else (n_paths + 1) // 2
 
-    # Normal shocks for base paths
-    Z = np.random.normal(size=(base_paths, n_steps))
+    # Normal shocks for base paths, antithetic twins filled in place (no vstack copy)
+    Z = np.empty((n_paths, n_steps), dtype=dtype)
+    if sampler == "pseudo":
+        rng.standard_normal(out=Z[:base_paths], dtype=dtype)
+    elif sampler == "lhs":
+        lhs = qmc.LatinHypercube(d=n_steps, seed=rng)
+        Z[:base_paths] = norm.ppf(lhs.random(base_paths))
+    else:
+        raise ValueError(f"Unknown sampler: {sampler}")
     if antithetic:
-        Z = np.vstack([Z, -Z])
-    Z = Z[:n_paths, :]
+        np.negative(Z[:n_paths - base_paths], out=Z[base_paths:])
 
     drift = (r - 0.5 * sigma**2) * dt
     diffusion = sigma * np.sqrt(dt)
 
+    # Log-increments built in place in Z, then accumulated along each (contiguous) row
+    Z *= diffusion
+    Z += drift
+
     # log S paths
-    log_S = np.zeros((n_paths, n_steps + 1))
+    log_S = np.empty((n_paths, n_steps + 1), dtype=dtype)
     log_S[:, 0] = np.log(S0)
+    np.cumsum(Z, axis=1, out=log_S[:, 1:])
+    log_S[:, 1:] += np.log(S0)
 
-    for t in range(1, n_steps + 1):
-        log_S[:, t] = log_S[:, t - 1] + drift + diffusion * Z[:, t - 1]
-
-    S_paths = np.exp(log_S)
+    S_paths = np.exp(log_S, out=log_S)
     return S_paths
 
 
+def _brownian_bridge_schedule(n_steps: int) -> List[Tuple[int, int, int]]:
+    """
+    Order in which grid points are filled by the Brownian bridge, as (left, mid, right)
+    index triples. Intervals are bisected breadth-first, so earlier QMC dimensions
+    set the coarse shape of the path and later ones only add fine detail.
+    """
+    schedule = []
+    intervals = [(0, n_steps)]
+    while intervals:
+        next_intervals = []
+        for left, right in intervals:
+            if right - left < 2:
+                continue
+            mid = (left + right) // 2
+            schedule.append((left, mid, right))
+            next_intervals += [(left, mid), (mid, right)]
+        intervals = next_intervals
+    return schedule
+
+
+def simulate_gbm_paths_qmc(
+    params: BarrierOptionParams,
+    n_paths: int,
+    n_steps: int,
+    scramble: bool = True,
+    seed: int | np.random.SeedSequence | None = None,
+    dtype: type = np.float64,
+) -> np.ndarray:
+    """
+    Simulate GBM paths from a Sobol' sequence with Brownian-bridge construction.
+    Dimension 0 sets W(T), dimension 1 the midpoint, and so on by bisection.
+    n_paths must be a power of two: Sobol' points are only balanced in blocks of
+    2**m. There is no antithetic option, as mirroring the points breaks that balance.
+    Returns an array of shape (n_paths, n_steps + 1).
+    """
+    m = int(n_paths).bit_length() - 1
+    if n_paths < 1 or n_paths != 1 << m:
+        raise ValueError(f"Sobol' sampling needs n_paths to be a power of two, got {n_paths}")
+
+    S0, r, sigma, T = params.S0, params.r, params.sigma, params.T
+    t = np.linspace(0.0, T, n_steps + 1)
+
+    sobol = qmc.Sobol(d=n_steps, scramble=scramble, seed=np.random.default_rng(seed))
+    if scramble:
+        U = sobol.random_base2(m)
+    else:
+        # the unscrambled first point is 0, which maps to -inf; take the next 2**m instead
+        sobol.fast_forward(1)
+        U = sobol.random(n_paths)
+    Z = norm.ppf(U).astype(dtype, copy=False)
+
+    # Brownian motion on the grid, W(0) = 0
+    W = np.zeros((n_paths, n_steps + 1), dtype=dtype)
+    W[:, n_steps] = np.sqrt(T) * Z[:, 0]
+    for k, (left, mid, right) in enumerate(_brownian_bridge_schedule(n_steps), start=1):
+        t_l, t_m, t_r = t[left], t[mid], t[right]
+        w_l = (t_r - t_m) / (t_r - t_l)
+        w_r = (t_m - t_l) / (t_r - t_l)
+        std = np.sqrt((t_m - t_l) * (t_r - t_m) / (t_r - t_l))
+        W[:, mid] = w_l * W[:, left] + w_r * W[:, right] + std * Z[:, k]
+
+    log_S = W
+    log_S *= sigma
+    log_S += (np.log(S0) + (r - 0.5 * sigma**2) * t).astype(dtype)
+    return np.exp(log_S, out=log_S)
+
+
+def simulate_gbm_extremes(
+    params: BarrierOptionParams,
+    n_paths: int,
+    n_steps: int,
+    antithetic: bool = True,
+    seed: int | np.random.SeedSequence | None = None,
+    dtype: type = np.float64,
+    drop_knocked_out: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stream GBM paths one time step at a time, keeping only what the barrier
+    payoff needs instead of the full (n_paths, n_steps + 1) array.
+    dtype: working precision of the per-path buffers (np.float32 or np.float64).
+    drop_knocked_out: stop advancing (and drawing shocks for) paths once they have
+    hit the barrier. The ST of every knocked-out path is then NaN, since it may
+    have stopped early; the barrier payoff (always 0 for them) is unaffected.
+    Returns:
+        ST: terminal prices, shape (n_paths,)
+        extreme: running minimum (down-and-out) or maximum (up-and-out) price
+    """
+    rng = np.random.default_rng(seed)
+
+    S0, r, sigma, T = params.S0, params.r, params.sigma, params.T
+    dt = T / n_steps
+
+    if params.barrier_type == "down-and-out":
+        update_extreme = np.minimum
+    elif params.barrier_type == "up-and-out":
+        update_extreme = np.maximum
+    else:
+        raise ValueError(f"Unknown barrier_type: {params.barrier_type}")
+
+    base_paths = n_paths if not antithetic else (n_paths + 1) // 2
+
+    drift = (r - 0.5 * sigma**2) * dt
+    diffusion = sigma * np.sqrt(dt)
+
+    log_S = np.full(n_paths, np.log(S0), dtype=dtype)
+    extreme = log_S.copy()
+
+    # Shocks are drawn for the base paths only; antithetic paths reuse them with
+    # the sign flipped inside the update, so nothing is negated or copied
+    dW = np.empty(base_paths, dtype=dtype)
+    log_S_base = log_S[:base_paths]
+    log_S_anti = log_S[base_paths:]
+    dW_anti = dW[:n_paths - base_paths]
+
+    # Once compacted, only the surviving paths are advanced: `active` indexes them in
+    # the full arrays, and `shock_idx`/`shock_sign` map each one to its (signed) shock
+    # in dW, which then only holds one draw per surviving antithetic pair
+    log_B = np.log(params.barrier)
+    active = None
+
+    for t in range(n_steps):
+        rng.standard_normal(out=dW, dtype=dtype)
+        dW *= diffusion
+
+        if active is None:
+            log_S_base += dW
+            if antithetic:
+                log_S_anti -= dW_anti
+            log_S += drift
+            update_extreme(extreme, log_S, out=extreme)
+        else:
+            log_S_act += drift + shock_sign * dW[shock_idx]
+            update_extreme(extreme_act, log_S_act, out=extreme_act)
+
+        if drop_knocked_out and (t + 1) % _COMPACT_EVERY == 0 and t + 1 < n_steps:
+            if active is None:
+                active = np.arange(n_paths)
+                log_S_act, extreme_act = log_S, extreme
+            alive = extreme_act > log_B if update_extreme is np.minimum else extreme_act < log_B
+            if alive.sum() < _COMPACT_BELOW * len(active):
+                # write back the current state, then shrink the working set
+                log_S[active] = log_S_act
+                extreme[active] = extreme_act
+                active = active[alive]
+                log_S_act = log_S[active]
+                extreme_act = extreme[active]
+                pair = np.where(active < base_paths, active, active - base_paths)
+                _, shock_idx = np.unique(pair, return_inverse=True)
+                shock_sign = np.where(active < base_paths, 1.0, -1.0).astype(dtype)
+                dW = np.empty(shock_idx.max() + 1 if len(active) else 0, dtype=dtype)
+            elif log_S_act is log_S:
+                # nothing dropped yet, keep using the fast full-array update
+                active = None
+
+    if active is not None:
+        log_S[active] = log_S_act
+        extreme[active] = extreme_act
+
+    ST = np.exp(log_S)
+    extreme = np.exp(extreme)
+    if drop_knocked_out:
+        B = params.barrier
+        knocked_out = extreme <= B if update_extreme is np.minimum else extreme >= B
+        ST[knocked_out] = np.nan
+    return ST, extreme
+
+
+# Moments of (X, Y) = (discounted barrier payoff, discounted vanilla payoff) over a set of paths:
+# (count, mean X, M2 X, mean Y, M2 Y, co-moment XY), with M2 the sum of squared deviations
+Moments = Tuple[int, float, float, float, float, float]
+
+
+@njit(fastmath=True, cache=True)
+def _welford_update(stats, x, y):
+    """Fold one (x, y) sample into a running moments row (Welford's online update)."""
+    stats[0] += 1.0
+    dx = x - stats[1]
+    stats[1] += dx / stats[0]
+    dy = y - stats[3]
+    stats[3] += dy / stats[0]
+    stats[2] += dx * (x - stats[1])
+    stats[4] += dy * (y - stats[3])
+    stats[5] += dx * (y - stats[3])
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _simulate_and_price(
+    S0, K, r, sigma, T, B, n_paths, n_steps, is_down, is_call, antithetic, block_seeds, drop_knocked_out
+):
+    """
+    JIT kernel: simulate each path with scalar log-price and running extreme, and
+    fold its discounted barrier and vanilla payoffs into per-block running moments.
+    No per-path or 2D array is allocated.
+    With drop_knocked_out, a path (or antithetic pair) stops stepping once knocked
+    out; the vanilla (Y) moments are then meaningless and must not be used.
+    Blocks of paths run in parallel, block b seeded with block_seeds[b].
+    Returns an (n_blocks, 6) array, one `Moments` row per block.
+    """
+    dt = T / n_steps
+    drift = (r - 0.5 * sigma**2) * dt
+    diffusion = sigma * np.sqrt(dt)
+    log_S0 = np.log(S0)
+    log_B = np.log(B)
+    discount_factor = np.exp(-r * T)
+
+    n_blocks = (n_paths + _MC_BLOCK_SIZE - 1) // _MC_BLOCK_SIZE
+    block_stats = np.zeros((n_blocks, 6))
+
+    for b in prange(n_blocks):
+        np.random.seed(block_seeds[b])
+        start = b * _MC_BLOCK_SIZE
+        stop = min(start + _MC_BLOCK_SIZE, n_paths)
+        stride = 2 if antithetic else 1
+        stats = block_stats[b]
+
+        for i in range(start, stop, stride):
+            # (x1, m1): path driven by Z; (x2, m2): its antithetic twin driven by -Z
+            x1 = log_S0
+            m1 = log_S0
+            x2 = log_S0
+            m2 = log_S0
+            for _ in range(n_steps):
+                dz = diffusion * np.random.standard_normal()
+                x1 += drift + dz
+                x2 += drift - dz
+                if is_down:
+                    m1 = min(m1, x1)
+                    m2 = min(m2, x2)
+                    if drop_knocked_out and m1 <= log_B and (m2 <= log_B or not antithetic):
+                        break
+                else:
+                    m1 = max(m1, x1)
+                    m2 = max(m2, x2)
+                    if drop_knocked_out and m1 >= log_B and (m2 >= log_B or not antithetic):
+                        break
+
+            ST = np.exp(x1)
+            vanilla = max(ST - K, 0.0) if is_call else max(K - ST, 0.0)
+            hit = m1 <= log_B if is_down else m1 >= log_B
+            payoff = 0.0 if hit else vanilla
+            _welford_update(stats, discount_factor * payoff, discount_factor * vanilla)
+
+            if antithetic and i + 1 < stop:
+                ST = np.exp(x2)
+                vanilla = max(ST - K, 0.0) if is_call else max(K - ST, 0.0)
+                hit = m2 <= log_B if is_down else m2 >= log_B
+                payoff = 0.0 if hit else vanilla
+                _welford_update(stats, discount_factor * payoff, discount_factor * vanilla)
+
+    return block_stats
+
+
+def _combine_moments(a: Moments, b: Moments) -> Moments:
+    """Merge the moments of two disjoint sample sets (Chan et al. parallel formula)."""
+    n_a, mean_xa, m2_xa, mean_ya, m2_ya, c_a = a
+    n_b, mean_xb, m2_xb, mean_yb, m2_yb, c_b = b
+    n = n_a + n_b
+    if n_a == 0 or n_b == 0:
+        return a if n_b == 0 else b
+
+    dx = mean_xb - mean_xa
+    dy = mean_yb - mean_ya
+    weight = n_a * n_b / n
+    return (
+        n,
+        mean_xa + dx * n_b / n,
+        m2_xa + m2_xb + dx * dx * weight,
+        mean_ya + dy * n_b / n,
+        m2_ya + m2_yb + dy * dy * weight,
+        c_a + c_b + dx * dy * weight,
+    )
+
+
+def _moments(X: np.ndarray, Y: np.ndarray) -> Moments:
+    """Two-pass moments of paired samples X, Y."""
+    mean_x = X.mean()
+    mean_y = Y.mean()
+    dX = X - mean_x
+    dY = Y - mean_y
+    return len(X), float(mean_x), float(np.dot(dX, dX)), float(mean_y), float(np.dot(dY, dY)), float(np.dot(dX, dY))
+
+
+def _mc_moments_numba(
+    params: BarrierOptionParams,
+    n_paths: int,
+    n_steps: int,
+    antithetic: bool,
+    seed: int | np.random.SeedSequence | None,
+    drop_knocked_out: bool = False,
+) -> Moments:
+    """Validate params, dispatch to the JIT kernel and merge its per-block moments."""
+    if params.barrier_type not in ("down-and-out", "up-and-out"):
+        raise ValueError(f"Unknown barrier_type: {params.barrier_type}")
+    if params.option_type not in ("call", "put"):
+        raise ValueError(f"Unknown option_type: {params.option_type}")
+
+    # Independent per-block seeds, so nearby user seeds don't share block streams
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    n_blocks = (n_paths + _MC_BLOCK_SIZE - 1) // _MC_BLOCK_SIZE
+    block_seeds = seed.generate_state(n_blocks)
+
+    # Plain floats/ints/bools, so integer-valued params reuse the warmed-up compiled signature
+    block_stats = _simulate_and_price(
+        float(params.S0), float(params.K), float(params.r), float(params.sigma),
+        float(params.T), float(params.barrier),
+        int(n_paths), int(n_steps),
+        params.barrier_type == "down-and-out",
+        params.option_type == "call",
+        bool(antithetic), block_seeds, bool(drop_knocked_out),
+    )
+
+    moments = (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    for row in block_stats:
+        moments = _combine_moments(moments, (int(row[0]), *row[1:].tolist()))
+    if drop_knocked_out:
+        # the kernel's vanilla payoffs are wrong for paths that stopped early
+        n, mean_x, m2_x = moments[:3]
+        moments = (n, mean_x, m2_x, np.nan, np.nan, np.nan)
+    return moments
+
+
+def _use_jit_kernel() -> bool:
+    """
+    Whether pseudo-random pricing should use the JIT kernel. Its scalar draws are
+    slower than the NumPy streaming path, so it only pays off when prange can
+    spread blocks over several threads (never inside single-threaded pool workers).
+    """
+    return USE_NUMBA and get_num_threads() > 1
+
+
+def _mc_chunk(
+    params: BarrierOptionParams,
+    n_paths: int,
+    n_steps: int,
+    antithetic: bool,
+    seed: int | np.random.SeedSequence | None,
+    sampler: str = "pseudo",
+    dtype: type = np.float64,
+    drop_knocked_out: bool = False,
+) -> Moments:
+    """
+    Price one chunk of paths. Self-contained so it can run in a worker process.
+    Returns the `Moments` of X, the discounted barrier payoffs, and Y, the
+    discounted vanilla payoffs on the same paths (the control variate).
+    drop_knocked_out: stop simulating knocked-out paths early ("pseudo" sampler
+    only). The Y moments are then NaN.
+    """
+    if sampler == "sobol":
+        S_paths = simulate_gbm_paths_qmc(params, n_paths, n_steps, seed=seed, dtype=dtype)
+        payoffs = barrier_payoffs_from_paths(S_paths, params)
+        ST = S_paths[:, -1]
+    elif sampler == "lhs":
+        S_paths = simulate_gbm_paths(
+            params, n_paths, n_steps, antithetic=antithetic, seed=seed, sampler="lhs", dtype=dtype
+        )
+        payoffs = barrier_payoffs_from_paths(S_paths, params)
+        ST = S_paths[:, -1]
+    elif sampler != "pseudo":
+        raise ValueError(f"Unknown sampler: {sampler}")
+    elif _use_jit_kernel() and dtype == np.float64:
+        return _mc_moments_numba(params, n_paths, n_steps, antithetic, seed, drop_knocked_out)
+    else:
+        ST, extreme = simulate_gbm_extremes(
+            params, n_paths, n_steps, antithetic=antithetic, seed=seed, dtype=dtype,
+            drop_knocked_out=drop_knocked_out,
+        )
+
+        # Compute payoffs (all paths at once)
+        payoffs = barrier_payoffs_from_extremes(ST, extreme, params)
+
+    # Reductions always run in float64, whatever the path precision
+    payoffs = payoffs.astype(np.float64, copy=False)
+    ST = ST.astype(np.float64, copy=False)
+
+    discount_factor = np.exp(-params.r * params.T)
+    X = discount_factor * payoffs
+    Y = discount_factor * vanilla_payoffs(ST, params)
+    return _moments(X, Y)
+
+
+def _chunk_sizes(n_paths: int, n_chunks: int, antithetic: bool) -> list[int]:
+    """Split n_paths into n_chunks sizes; even sizes under antithetic so pairs stay together."""
+    size = n_paths // n_chunks
+    if antithetic:
+        size -= size % 2
+    sizes = [size] * (n_chunks - 1)
+    sizes.append(n_paths - sum(sizes))
+    return [n for n in sizes if n > 0]
+
+
+# Worker pools for n_jobs > 1, created once per worker count and reused across calls
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+
+
+def _init_worker():
+    """
+    Worker process initializer: one Numba thread per process (the processes are the
+    parallelism), so each chunk takes the NumPy streaming path.
+    """
+    set_num_threads(1)
+
+
+def _worker_ready() -> bool:
+    return True
+
+
+def _get_pool(n_jobs: int) -> ProcessPoolExecutor:
+    """Return the shared pool for n_jobs workers, starting and warming it on first use."""
+    pool = _POOLS.get(n_jobs)
+    if pool is None:
+        # spawn rather than fork: forking after Numba's thread pool has started can deadlock
+        ctx = multiprocessing.get_context("spawn")
+        pool = ProcessPoolExecutor(max_workers=n_jobs, mp_context=ctx, initializer=_init_worker)
+        # one trivial task per worker so every process has started and run the initializer
+        try:
+            for future in [pool.submit(_worker_ready) for _ in range(n_jobs)]:
+                future.result()
+        except BrokenProcessPool:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        _POOLS[n_jobs] = pool
+    return pool
+
+
+def _discard_pool(n_jobs: int):
+    """Drop a broken pool from the cache so the next call starts a fresh one."""
+    pool = _POOLS.pop(n_jobs, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def warmup(n_jobs: int = 1):
+    """
+    Compile (or load from the on-disk cache) the JIT kernel if it will be used and,
+    for n_jobs > 1, start the worker pool, so neither cost lands in a timed pricing call.
+    """
+    if _use_jit_kernel():
+        _mc_moments_numba(DEFAULT_PARAMS, 2, 2, True, 0)
+    if n_jobs > 1:
+        _get_pool(n_jobs)
+
+
 def price_barrier_monte_carlo(
     params: BarrierOptionParams,
     n_paths: int,
     n_steps: int,
     antithetic: bool = True,
     seed: int | None = None,
+    n_jobs: int = 1,
+    sampler: str = "pseudo",
+    control_variate: bool = False,
+    dtype: type = np.float64,
 ) -> Tuple[float, float, float]:
     """
     Monte Carlo price for a barrier option.
 
+    With n_jobs > 1, paths are split into chunks priced in separate processes,
+    each with an independent stream from SeedSequence(seed).spawn(n_jobs). The
+    worker pool is started once and reused; its startup is not included in runtime.
+    If a worker dies, the call raises BrokenProcessPool and the next call starts
+    a new pool. Workers use the "spawn" start method, which re-imports the calling
+    script: a script that uses n_jobs > 1 must put its entry point under
+    `if __name__ == "__main__":`, or the workers crash with BrokenProcessPool.
+
+    sampler: "pseudo" for i.i.d. normals, "lhs" for Latin hypercube stratified
+    normals, or "sobol" for scrambled Sobol' points with Brownian-bridge path
+    construction (quasi-Monte Carlo). For "lhs" and "sobol" the reported std_error
+    uses the i.i.d. formula and is conservative. Both ignore `antithetic`, and
+    "sobol" needs n_paths (per chunk, with n_jobs > 1) to be a power of two.
+
+    control_variate: if True, use the vanilla option on the same paths as a control
+    variate, with its Black-Scholes price as the known mean and the optimal
+    coefficient beta = Cov(X, Y) / Var(Y) estimated from all samples.
+
+    dtype: path precision. np.float32 runs the NumPy path simulation in single
+    precision (the JIT kernel is float64-only); price and std_error are
+    accumulated in float64 either way.
+
     Returns:
         price: MC estimate of option price
         std_error: standard error of the estimate
         runtime: wall-clock time in seconds
     """
+    if n_paths < 1:
+        raise ValueError(f"n_paths must be at least 1, got {n_paths}")
+
+    if sampler == "sobol":
+        # Sobol' points are not mirrored (see simulate_gbm_paths_qmc), and every
+        # chunk must be a power of two for the points to stay balanced
+        antithetic = False
+        sizes = _chunk_sizes(n_paths, max(n_jobs, 1), antithetic)
+        if any(size & (size - 1) for size in sizes):
+            raise ValueError(
+                f"sampler='sobol' needs n_paths / n_jobs to be a power of two, "
+                f"got n_paths={n_paths}, n_jobs={n_jobs}"
+            )
+
+    # Knocked-out paths can stop early unless their vanilla payoff is needed as the control
+    drop_knocked_out = not control_variate
+
+    pool = _get_pool(n_jobs) if n_jobs > 1 else None
+
     start_time = time.time()
 
-    S_paths = simulate_gbm_paths(params, n_paths, n_steps, antithetic=antithetic, seed=seed)
+    if pool is None:
+        partials = [_mc_chunk(params, n_paths, n_steps, antithetic, seed, sampler, dtype, drop_knocked_out)]
+    else:
+        sizes = _chunk_sizes(n_paths, n_jobs, antithetic)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        try:
+            futures = [
+                pool.submit(
+                    _mc_chunk, params, size, n_steps, antithetic, chunk_seed, sampler, dtype, drop_knocked_out
+                )
+                for size, chunk_seed in zip(sizes, seeds)
+            ]
+            partials = [f.result() for f in futures]
+        except BrokenProcessPool:
+            # a worker died; don't leave the dead pool cached for later calls
+            _discard_pool(n_jobs)
+            raise
 
-    # Compute discounted payoffs
-    payoffs = np.zeros(n_paths)
-    for i in range(n_paths):
-        payoffs[i] = barrier_payoff_from_path(S_paths[i, :], params)
+    moments = partials[0]
+    for partial in partials[1:]:
+        moments = _combine_moments(moments, partial)
+    n, mean_x, m2_x, mean_y, m2_y, c_xy = moments
 
-    discount_factor = np.exp(-params.r * params.T)
-    discounted_payoffs = discount_factor * payoffs
+    if n < 2:
+        # A single path gives no sample variance
+        price = mean_x
+        variance = np.nan
+    elif control_variate:
+        var_x = m2_x / (n - 1)
+        var_y = m2_y / (n - 1)
+        cov_xy = c_xy / (n - 1)
+        beta = cov_xy / var_y if var_y > 0.0 else 0.0
+
+        price = mean_x - beta * (mean_y - black_scholes_price(params))
+        variance = var_x - 2.0 * beta * cov_xy + beta**2 * var_y
+    else:
+        price = mean_x
+        variance = m2_x / (n - 1)
 
-    price = discounted_payoffs.mean()
-    std_error = discounted_payoffs.std(ddof=1) / np.sqrt(n_paths)
+    std_error = np.sqrt(np.maximum(variance, 0.0) / n)  # np.maximum keeps the n < 2 NaN
     runtime = time.time() - start_time
 
-    return price, std_error, runtime
\ No newline at end of file
+    return price, std_error, runtime
@@ -0,0 +1,92 @@
+# tests/test_binomial_tree.py
+
+import math
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.config import DEFAULT_PARAMS
+from src.binomial_tree import (
+    _crr_backward,
+    _crr_backward_numpy,
+    _maturity_values,
+    price_barrier_binomial_tree,
+)
+
+PARAMS = [
+    replace(DEFAULT_PARAMS, barrier=90.0, barrier_type="down-and-out", option_type="call"),
+    replace(DEFAULT_PARAMS, barrier=90.0, barrier_type="down-and-out", option_type="put"),
+    replace(DEFAULT_PARAMS, barrier=115.0, barrier_type="up-and-out", option_type="call"),
+    replace(DEFAULT_PARAMS, barrier=115.0, barrier_type="up-and-out", option_type="put"),
+]
+STEPS = [1, 2, 3, 7, 50, 101]
+
+
+def _params_id(params):
+    return f"{params.barrier_type}-{params.option_type}"
+
+
+def _reference_price(params, n_steps):
+    """Straightforward CRR tree with every node price computed by pow (the original implementation)."""
+    S0, K, r, sigma, T, B = params.S0, params.K, params.r, params.sigma, params.T, params.barrier
+    is_down = params.barrier_type == "down-and-out"
+
+    dt = T / n_steps
+    disc = math.exp(-r * dt)
+    u = math.exp(sigma * math.sqrt(dt))
+    d = 1.0 / u
+    p = (math.exp(r * dt) - d) / (u - d)
+
+    def knocked_out(S):
+        return S <= B if is_down else S >= B
+
+    def vanilla(S):
+        return max(S - K, 0.0) if params.option_type == "call" else max(K - S, 0.0)
+
+    values = []
+    for j in range(n_steps + 1):
+        S_T = S0 * u**j * d ** (n_steps - j)
+        values.append(0.0 if knocked_out(S_T) else vanilla(S_T))
+
+    for i in range(n_steps - 1, -1, -1):
+        for j in range(i + 1):
+            S_ij = S0 * u**j * d ** (i - j)
+            values[j] = 0.0 if knocked_out(S_ij) else disc * (p * values[j + 1] + (1 - p) * values[j])
+
+    return values[0]
+
+
+def _backward(kernel, params, n_steps):
+    dt = params.T / n_steps
+    disc = math.exp(-params.r * dt)
+    u = math.exp(params.sigma * math.sqrt(dt))
+    d = 1.0 / u
+    p = (math.exp(params.r * dt) - d) / (u - d)
+
+    option_values = _maturity_values(params, n_steps, u)
+    option_values = kernel(
+        option_values, n_steps, params.S0, u, d, disc * p, disc * (1.0 - p), params.barrier,
+        params.barrier_type == "down-and-out",
+    )
+    return option_values[0]
+
+
+@pytest.mark.parametrize("n_steps", STEPS)
+@pytest.mark.parametrize("params", PARAMS, ids=_params_id)
+def test_kernels_match_pow_reference(params, n_steps):
+    expected = _reference_price(params, n_steps)
+
+    jit_price = _backward(_crr_backward, params, n_steps)
+    numpy_price = _backward(_crr_backward_numpy, params, n_steps)
+
+    assert jit_price == pytest.approx(expected, rel=1e-10, abs=1e-12)
+    assert numpy_price == pytest.approx(expected, rel=1e-10, abs=1e-12)
+    assert jit_price == pytest.approx(numpy_price, rel=1e-10, abs=1e-12)
+
+
+@pytest.mark.parametrize("params", PARAMS, ids=_params_id)
+def test_price_barrier_binomial_tree_matches_reference(params):
+    price, runtime = price_barrier_binomial_tree(params, n_steps=51)
+    assert price == pytest.approx(_reference_price(params, 51), rel=1e-10, abs=1e-12)
+    assert runtime >= 0.0
@@ -0,0 +1,161 @@
+# tests/test_monte_carlo.py
+
+import numpy as np
+import pytest
+
+from src.config import BarrierOptionParams, DEFAULT_PARAMS
+from src.barrier_option import barrier_payoffs_from_extremes, vanilla_payoffs
+from src.jit import USE_NUMBA
+from src.monte_carlo import (
+    _MC_BLOCK_SIZE,
+    _combine_moments,
+    _mc_moments_numba,
+    _moments,
+    _simulate_and_price,
+    simulate_gbm_extremes,
+)
+
+# Barriers close to S0, so most paths are knocked out before the first compaction check
+DOWN_AND_OUT = BarrierOptionParams(
+    S0=100.0, K=100.0, r=0.05, sigma=0.2, T=1.0, barrier=98.0,
+    barrier_type="down-and-out", option_type="call",
+)
+UP_AND_OUT = BarrierOptionParams(
+    S0=100.0, K=100.0, r=0.05, sigma=0.2, T=1.0, barrier=103.0,
+    barrier_type="up-and-out", option_type="put",
+)
+SEEDS = range(20)
+
+
+def _assert_mean_zero(diffs, n_sigma=4.0):
+    """The mean of i.i.d. per-seed differences is within n_sigma standard errors of 0."""
+    diffs = np.asarray(diffs)
+    std_error = diffs.std(ddof=1) / np.sqrt(len(diffs))
+    assert abs(diffs.mean()) < n_sigma * std_error
+
+
+def _numpy_price(params, seed, drop_knocked_out):
+    ST, extreme = simulate_gbm_extremes(
+        params, n_paths=20_000, n_steps=200, seed=seed, drop_knocked_out=drop_knocked_out
+    )
+    return np.exp(-params.r * params.T) * barrier_payoffs_from_extremes(ST, extreme, params).mean()
+
+
+@pytest.mark.parametrize("params", [DOWN_AND_OUT, UP_AND_OUT], ids=lambda p: p.barrier_type)
+def test_dropping_knocked_out_paths_is_unbiased(params):
+    diffs = [
+        _numpy_price(params, seed, drop_knocked_out=True) - _numpy_price(params, seed, drop_knocked_out=False)
+        for seed in SEEDS
+    ]
+    _assert_mean_zero(diffs)
+
+
+@pytest.mark.parametrize("params", [DOWN_AND_OUT, UP_AND_OUT], ids=lambda p: p.barrier_type)
+def test_dropped_paths_have_nan_terminal_price(params):
+    ST, extreme = simulate_gbm_extremes(params, n_paths=5_000, n_steps=200, seed=1, drop_knocked_out=True)
+    if params.barrier_type == "down-and-out":
+        knocked_out = extreme <= params.barrier
+    else:
+        knocked_out = extreme >= params.barrier
+
+    assert knocked_out.any() and not knocked_out.all()
+    assert np.isnan(ST[knocked_out]).all()
+    assert np.isfinite(ST[~knocked_out]).all()
+
+
+@pytest.mark.skipif(not USE_NUMBA, reason="JIT kernel needs Numba")
+@pytest.mark.parametrize("antithetic", [True, False])
+@pytest.mark.parametrize("params", [DOWN_AND_OUT, UP_AND_OUT], ids=lambda p: p.barrier_type)
+def test_jit_early_exit_is_unbiased(params, antithetic):
+    diffs = []
+    for seed in SEEDS:
+        dropped = _mc_moments_numba(params, 20_000, 200, antithetic, seed, drop_knocked_out=True)
+        full = _mc_moments_numba(params, 20_000, 200, antithetic, seed, drop_knocked_out=False)
+        assert dropped[0] == full[0] == 20_000
+        diffs.append(dropped[1] - full[1])
+    _assert_mean_zero(diffs)
+
+
+@pytest.mark.skipif(not USE_NUMBA, reason="JIT kernel needs Numba")
+def test_jit_early_exit_has_nan_control_moments():
+    moments = _mc_moments_numba(DOWN_AND_OUT, 4_096, 50, True, 0, drop_knocked_out=True)
+    assert np.isfinite(moments[1:3]).all()
+    assert np.isnan(moments[3:]).all()
+
+
+def test_combine_moments_matches_two_pass_on_concatenation():
+    rng = np.random.default_rng(0)
+    X = rng.exponential(5.0, size=1_000)
+    Y = X + rng.standard_normal(1_000)
+    splits = [0, 1, 1, 250, 999, 1_000]  # includes empty and single-sample parts
+
+    combined = (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    for lo, hi in zip(splits[:-1], splits[1:]):
+        part = _moments(X[lo:hi], Y[lo:hi]) if hi > lo else (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        combined = _combine_moments(combined, part)
+
+    expected = _moments(X, Y)
+    assert combined[0] == expected[0]
+    np.testing.assert_allclose(combined[1:], expected[1:], rtol=1e-10)
+
+
+def _reference_block_payoffs(params, n, n_steps, antithetic, block_seed):
+    """
+    Discounted (barrier, vanilla) payoffs of one kernel block, recomputed with NumPy
+    from the same seeded stream: one normal per step per path (or antithetic pair),
+    paths in order, each pair as (Z, -Z).
+    """
+    dt = params.T / n_steps
+    drift = (params.r - 0.5 * params.sigma**2) * dt
+    diffusion = params.sigma * np.sqrt(dt)
+
+    n_draws = (n + 1) // 2 if antithetic else n
+    Z = np.random.RandomState(block_seed).standard_normal((n_draws, n_steps))
+    if antithetic:
+        increments = np.stack([drift + diffusion * Z, drift - diffusion * Z], axis=1)
+        increments = increments.reshape(2 * n_draws, n_steps)[:n]
+    else:
+        increments = drift + diffusion * Z
+
+    log_S = np.log(params.S0) + np.cumsum(increments, axis=1)
+    ST = np.exp(log_S[:, -1])
+    if params.barrier_type == "down-and-out":
+        extreme = np.minimum(np.exp(log_S.min(axis=1)), params.S0)
+    else:
+        extreme = np.maximum(np.exp(log_S.max(axis=1)), params.S0)
+
+    discount_factor = np.exp(-params.r * params.T)
+    X = discount_factor * barrier_payoffs_from_extremes(ST, extreme, params)
+    Y = discount_factor * vanilla_payoffs(ST, params)
+    return X, Y
+
+
+@pytest.mark.skipif(not USE_NUMBA, reason="JIT kernel needs Numba")
+@pytest.mark.parametrize("antithetic", [True, False])
+@pytest.mark.parametrize("params", [DEFAULT_PARAMS, UP_AND_OUT], ids=lambda p: p.barrier_type)
+def test_jit_block_moments_match_numpy_two_pass(params, antithetic):
+    n_paths, n_steps = 2 * _MC_BLOCK_SIZE + 453, 16  # two full blocks and an odd partial one
+    block_seeds = np.random.SeedSequence(7).generate_state(3)
+
+    block_stats = _simulate_and_price(
+        params.S0, params.K, params.r, params.sigma, params.T, params.barrier,
+        n_paths, n_steps,
+        params.barrier_type == "down-and-out",
+        params.option_type == "call",
+        antithetic, block_seeds, False,
+    )
+
+    payoffs = []
+    for b, row in enumerate(block_stats):
+        n = min(_MC_BLOCK_SIZE, n_paths - b * _MC_BLOCK_SIZE)
+        X, Y = _reference_block_payoffs(params, n, n_steps, antithetic, block_seeds[b])
+        expected = _moments(X, Y)
+        assert int(row[0]) == expected[0]
+        np.testing.assert_allclose(row[1:], expected[1:], rtol=1e-9, atol=1e-9)
+        payoffs.append((X, Y))
+
+    # and the merged result equals one two-pass over all paths
+    moments = _mc_moments_numba(params, n_paths, n_steps, antithetic, np.random.SeedSequence(7))
+    expected = _moments(np.concatenate([X for X, _ in payoffs]), np.concatenate([Y for _, Y in payoffs]))
+    assert moments[0] == expected[0]
+    np.testing.assert_allclose(moments[1:], expected[1:], rtol=1e-9, atol=1e-9)